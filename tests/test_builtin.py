@@ -0,0 +1,187 @@
+import math
+import os
+import random
+import tempfile
+import unittest
+import wave
+
+from udsp.core import stat
+from udsp.signal.builtin import AudioChannel, Const1D, Const2D
+from udsp.signal.builtin import Jaehne1D, Pulse1D, Pulse2D
+from udsp.signal.builtin import ImageChannel, Noise1D, Noise2D
+
+
+class ConstTestCase(unittest.TestCase):
+
+    def test_const(self):
+
+        for k in (2, 0, 0.0, -1.5, 0j, 1 + 2j):
+            y = Const1D(k=k, length=3).get()
+            self.assertListEqual(y, [k] * 3)
+            self.assertTrue(all(type(s) is type(k) for s in y))
+            y = Const2D(k=k, length=(2, 3)).get()
+            self.assertListEqual(y, [[k] * 3] * 2)
+            self.assertTrue(all(type(s) is type(k) for row in y for s in row))
+
+
+class AudioChannelTestCase(unittest.TestCase):
+
+    def test_audio_channel_to_mono(self):
+
+        rnd = random.Random(0)
+        for bps in (8, 16, 24):
+            lo, hi = -(1 << (bps - 1)), (1 << (bps - 1)) - 1
+            left = [rnd.randint(lo, hi) for _ in range(1000)]
+            right = [rnd.randint(lo, hi) for _ in range(1000)]
+            # Halves must be rounded to even, i.e. without DC bias
+            mono = [round((l + r) / 2) for l, r in zip(left, right)]
+            self.assertListEqual(AudioChannel._to_mono([left, right]),
+                                 [mono])
+        self.assertListEqual(AudioChannel._to_mono([[1, -3, 5]]),
+                             [[1, -3, 5]])
+        self.assertListEqual(AudioChannel._to_mono([[1, 2, -1, -2],
+                                                    [2, 3, 0, -1]]),
+                             [[2, 2, 0, -2]])
+
+    def test_audio_channel_from_file_grid(self):
+
+        fd, filename = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            with wave.open(filename, "wb") as f:
+                f.setnchannels(3)
+                f.setsampwidth(2)
+                f.setframerate(100)
+                f.writeframes(bytes(3 * 2 * 50))
+            channels = AudioChannel.from_file(filename)
+        finally:
+            os.remove(filename)
+        x0 = channels[0].get(alls=True)[1]
+        self.assertListEqual(x0, [n * (1 / 100) for n in range(50)])
+        for channel in channels[1:]:
+            x = channel.get(alls=True)[1]
+            self.assertListEqual(x, x0)
+            self.assertIsNot(x, x0)
+        # A grid with a different sampling period is not reused
+        grid = [n / 10 for n in range(50)]
+        channel = AudioChannel([0] * 50, sfreq=100, _grid=grid)
+        self.assertListEqual(channel.get(alls=True)[1], x0)
+
+
+class ImageChannelTestCase(unittest.TestCase):
+
+    def test_image_channel_to_mono(self):
+
+        rnd = random.Random(0)
+        for bps in (8, 16):
+            for nchans in (3, 4):
+                planes = [[[rnd.randrange(1 << bps) for _ in range(20)]
+                           for _ in range(10)] for _ in range(nchans)]
+                # The alpha plane (if any) is ignored
+                mono = [[round(0.2126 * r + 0.7152 * g + 0.0722 * b)
+                         for r, g, b in zip(*rows)]
+                        for rows in zip(*planes[:3])]
+                self.assertListEqual(ImageChannel._to_mono(planes, bps),
+                                     [mono])
+        planes = [[[0, 255]], [[0, 255]], [[0, 255]]]
+        self.assertListEqual(ImageChannel._to_mono(planes), [[[0, 255]]])
+        gray = [[1, 2], [3, 4]]
+        self.assertListEqual(ImageChannel._to_mono([gray]), [gray])
+        self.assertListEqual(ImageChannel._to_mono([gray, gray]), [gray])
+
+    def test_image_channel_from_file_grid(self):
+
+        data = [[[(c + n + m) % 256 for m in range(5)] for n in range(4)]
+                for c in range(3)]
+        fd, filename = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        try:
+            ImageChannel.to_file(filename, [ImageChannel(d, length=(4, 5))
+                                            for d in data])
+            channels = ImageChannel.from_file(filename)
+        finally:
+            os.remove(filename)
+        x0 = channels[0].get(alls=True)[1]
+        self.assertListEqual(x0, [[(n, m) for m in range(5)]
+                                  for n in range(4)])
+        for c, channel in enumerate(channels):
+            y, x = channel.get(alls=True)
+            self.assertListEqual(y, data[c])
+            self.assertListEqual(x, x0)
+            if c > 0:
+                self.assertIsNot(x, x0)
+                for row, row0 in zip(x, x0):
+                    self.assertIsNot(row, row0)
+        # A grid with different sampling periods is not reused
+        grid = [[(n / 2, m / 2) for m in range(5)] for n in range(4)]
+        channel = ImageChannel(data[0], length=(4, 5), _grid=grid)
+        self.assertListEqual(channel.get(alls=True)[1], x0)
+
+
+class Jaehne1DTestCase(unittest.TestCase):
+
+    def test_jaehne1d(self):
+
+        for a, length, sfreq in ((1, 100, 1), (2.5, 3, 50), (1, 1, 1)):
+            signal = Jaehne1D(a=a, length=length, sfreq=sfreq)
+            N = round(length * sfreq)
+            self.assertEqual(len(signal), N)
+            self.assertEqual(len(signal.get(alls=True)[1]), N)
+            y = [a * math.sin(0.5 * math.pi * n * n / N) for n in range(N)]
+            for s, t in zip(signal.get(), y):
+                self.assertAlmostEqual(s, t)
+
+
+class PulseTestCase(unittest.TestCase):
+
+    def test_pulse1d(self):
+
+        # Edges on grid points, between grid points, negative width,
+        # partly and fully outside the grid
+        for xo, w in ((2, 2), (0.5, 1), (2.25, 1.3), (2, -1), (2, 0),
+                      (0, 1), (4.5, 2), (-3, 1), (10, 2), (2, 20)):
+            signal = Pulse1D(xo=xo, w=w, a=3, length=5, sfreq=2)
+            y, x = signal.get(alls=True)
+            x1, x2 = xo - w / 2, xo + w / 2
+            self.assertListEqual(y, [3 if x1 <= t <= x2 else 0
+                                     for t in x])
+        y = Pulse1D(xo=2, w=2, a=1, length=5, sfreq=1).get()
+        self.assertListEqual(y, [0, 1, 1, 1, 0])
+        y = Pulse1D(xo=2, w=-2, a=1, length=5, sfreq=1).get()
+        self.assertListEqual(y, [0, 0, 0, 0, 0])
+        y = Pulse1D(xo=2, w=2, a=0.0, length=5, sfreq=1).get()
+        self.assertIs(type(y[2]), float)
+
+    def test_pulse2d(self):
+
+        for xo, w in (((2, 1), (2, 1)), ((0.5, 2.25), (1.3, 2)),
+                      ((2, 2), (-1, 2)), ((-1, 1), (3, 1)),
+                      ((1, 10), (1, 1)), ((2, 1), (20, 20))):
+            signal = Pulse2D(xo=xo, w=w, a=3, length=(3, 4), sfreq=2)
+            y, x = signal.get(alls=True)
+            x1, x2 = xo[0] - w[0] / 2, xo[0] + w[0] / 2
+            y1, y2 = xo[1] - w[1] / 2, xo[1] + w[1] / 2
+            self.assertListEqual(
+                y,
+                [[3 if (y1 <= p[0] <= y2) and (x1 <= p[1] <= x2) else 0
+                  for p in row] for row in x]
+            )
+        y = Pulse2D(xo=(2, 1), w=(2, 0), a=1, length=(3, 4)).get()
+        self.assertListEqual(y, [[0, 0, 0, 0],
+                                 [0, 1, 1, 1],
+                                 [0, 0, 0, 0]])
+        y = Pulse2D(xo=(2, 1), w=(2, 0), a=0j, length=(3, 4)).get()
+        self.assertIs(type(y[1][2]), complex)
+
+
+class NoiseTestCase(unittest.TestCase):
+
+    def test_noise_seed(self):
+
+        stat.seed(7)
+        y1 = Noise1D(length=50).get()
+        m1 = Noise2D(length=(4, 5), pdf="uniform").get()
+        stat.seed(7)
+        self.assertListEqual(Noise1D(length=50).get(), y1)
+        self.assertListEqual(Noise2D(length=(4, 5), pdf="uniform").get(),
+                             m1)
@@ -0,0 +1,92 @@
+import os
+import random
+import tempfile
+import unittest
+import wave
+
+from array import array
+from udsp.core import media
+from udsp.core.media import Audio
+
+
+class AudioTestCase(unittest.TestCase):
+
+    def setUp(self):
+
+        fd, self.filename = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+
+    def tearDown(self):
+
+        os.remove(self.filename)
+
+    def _write_wav(self, data, Bps, nchans):
+
+        with wave.open(self.filename, "wb") as f:
+            f.setnchannels(nchans)
+            f.setsampwidth(Bps)
+            f.setframerate(8000)
+            f.writeframes(data)
+
+    def _load(self):
+
+        audio = Audio.from_file(self.filename)
+        try:
+            return audio.load()
+        finally:
+            del audio
+
+    def test_audio_wav_decode(self):
+
+        rnd = random.Random(0)
+        nchans, nframes = 2, 1000
+        for Bps in (1, 2, 3):
+            data = bytes(rnd.getrandbits(8)
+                         for _ in range(nframes * nchans * Bps))
+            self._write_wav(data, Bps, nchans)
+            # 8-bit WAV samples are unsigned, the others are signed
+            samples = [int.from_bytes(data[i:i + Bps], "little",
+                                      signed=(Bps > 1))
+                       for i in range(0, len(data), Bps)]
+            channels = self._load()
+            self.assertEqual(len(channels), nchans)
+            for c in range(nchans):
+                self.assertListEqual(list(channels[c]),
+                                     samples[c::nchans])
+
+    def test_audio_wav_truncated(self):
+
+        self._write_wav(bytes(3 * 2 * 100), 3, 2)
+        with open(self.filename, "rb") as f:
+            data = f.read()
+        # Drop part of the data chunk, keeping the header intact
+        with open(self.filename, "wb") as f:
+            f.write(data[:-100])
+        with self.assertRaises(RuntimeError):
+            self._load()
+
+
+class SamplesTestCase(unittest.TestCase):
+
+    def test_to_samples(self):
+
+        values = [-32768, -1, 0, 32767, -32768, 1000, -1, 1000]
+        v = media._to_samples(array("h", values))
+        self.assertIsInstance(v, list)
+        self.assertListEqual(v, values)
+        self.assertTrue(all(type(s) is int for s in v))
+        # Equal samples share the same int object
+        self.assertIs(v[0], v[4])
+        self.assertIs(v[1], v[6])
+        self.assertIs(v[5], v[7])
+        self.assertIs(v[5], media._to_samples(array("h", [1000]))[0])
+
+        values = [0, 65535, 40000, 65535, 40000]
+        v = media._to_samples(array("H", values))
+        self.assertListEqual(v, values)
+        self.assertIs(v[1], v[3])
+        self.assertIs(v[2], v[4])
+
+        values = [0, 255, 7]
+        self.assertListEqual(media._to_samples(array("B", values)), values)
+        self.assertListEqual(media._to_samples(bytearray(values)), values)
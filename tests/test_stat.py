@@ -0,0 +1,43 @@
+import unittest
+
+from udsp.core import stat
+
+
+class RNGTestCase(unittest.TestCase):
+
+    def test_rng_size(self):
+
+        for rng in (stat.rng_uniform,
+                    stat.rng_normal,
+                    stat.rng_cauchy_lorentz,
+                    stat.rng_laplace):
+            self.assertIsInstance(rng(), float)
+            v = rng(size=10)
+            self.assertIsInstance(v, list)
+            self.assertEqual(len(v), 10)
+            m = rng(size=(3, 4))
+            self.assertEqual(len(m), 3)
+            self.assertTrue(all(len(row) == 4 for row in m))
+            self.assertListEqual(rng(size=0), [])
+
+    def test_rng_trunc(self):
+
+        for rng in (stat.rng_normal,
+                    stat.rng_cauchy_lorentz,
+                    stat.rng_laplace):
+            v = rng(trunc=(-0.5, 0.25), size=1000)
+            self.assertEqual(len(v), 1000)
+            self.assertTrue(all(-0.5 <= s <= 0.25 for s in v))
+        v = stat.rng_uniform(a=2, b=3, size=1000)
+        self.assertTrue(all(2 <= s <= 3 for s in v))
+
+    def test_seed(self):
+
+        stat.seed(42)
+        v1 = stat.rng_normal(size=100)
+        m1 = stat.rng_laplace(size=(5, 5))
+        stat.seed(42)
+        v2 = stat.rng_normal(size=100)
+        m2 = stat.rng_laplace(size=(5, 5))
+        self.assertListEqual(v1, v2)
+        self.assertListEqual(m1, m2)
@@ -0,0 +1,37 @@
+import unittest
+
+from udsp.core import utils
+
+
+class UtilsTestCase(unittest.TestCase):
+
+    def test_to_axes(self):
+
+        x = [[(n * 0.5, m * 0.25) for m in range(4)] for n in range(3)]
+        ys, xs = utils.to_axes(x)
+        self.assertListEqual(ys, [0, 0.5, 1])
+        self.assertListEqual(xs, [0, 0.25, 0.5, 0.75])
+        self.assertEqual(utils.to_axes([[(1, 2)]]), ([1], [2]))
+        self.assertEqual(utils.to_axes([]), ([], []))
+        self.assertEqual(utils.to_axes([[], []]), ([], []))
+
+    def test_find_range(self):
+
+        v = [0, 1, 2, 3, 4, 5]
+        # Inclusive edges on grid points
+        self.assertEqual(utils.find_range(v, 1, 3), (1, 4))
+        self.assertEqual(utils.find_range(v, 0, 5), (0, 6))
+        self.assertEqual(utils.find_range(v, 2, 2), (2, 3))
+        # Edges between grid points
+        self.assertEqual(utils.find_range(v, 0.5, 3.5), (1, 4))
+        self.assertEqual(utils.find_range(v, 2.2, 2.8), (3, 3))
+        # Empty interval (b < a)
+        n1, n2 = utils.find_range(v, 3, 1)
+        self.assertEqual(n1, n2)
+        # Partly or fully outside the sequence
+        self.assertEqual(utils.find_range(v, -2, 1.5), (0, 2))
+        self.assertEqual(utils.find_range(v, 4, 10), (4, 6))
+        self.assertEqual(utils.find_range(v, -2, 10), (0, 6))
+        self.assertEqual(utils.find_range(v, -5, -1), (0, 0))
+        self.assertEqual(utils.find_range(v, 6, 9), (6, 6))
+        self.assertEqual(utils.find_range([], 0, 1), (0, 0))
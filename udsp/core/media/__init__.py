@@ -19,7 +19,7 @@ for specific image formats:
 
 """
 
-import itertools as _itools
+import functools as _fun
 
 from array import array
 from .base import MediaObject, MediaCodec, Metadata
@@ -77,8 +77,7 @@ class Image(MediaObject):
 
         for sline in data:
             for c in range(nchans):
-                it = _itools.islice(sline, c, None, nchans)
-                row = _mtx.vec_new(0, it)
+                row = _to_samples(sline[c::nchans])
                 channels[c].append(row)
         return channels
 
@@ -152,8 +151,7 @@ class Audio(MediaObject):
         channels = []
 
         for c in range(nchans):
-            it = _itools.islice(data, c, None, nchans)
-            chan = _mtx.vec_new(0, it)
+            chan = _to_samples(data[c::nchans])
             channels.append(chan)
         return channels
 
@@ -181,6 +179,64 @@ class Audio(MediaObject):
         return samples
 
 
+# ---------------------------------------------------------
+#                    Sample conversion
+# ---------------------------------------------------------
+
+
+@_fun.lru_cache(maxsize=None)
+def _int_table(atype):
+    """
+    Creates a table with all the values of a 16-bit sample type
+
+    The table is laid out so that it can be indexed directly by the
+    sample values, for both signed (negative indices) and unsigned
+    types.
+
+    Parameters
+    ----------
+    atype: {"h", "H"}
+        The array type code of the samples
+
+    Returns
+    -------
+    list[]
+        The table of int values
+
+    """
+    if atype == "h":
+        return [*range(0, 1 << 15), *range(-(1 << 15), 0)]
+    return [*range(0, 1 << 16)]
+
+
+def _to_samples(data):
+    """
+    Converts a raw array of samples into a vector
+
+    CPython only preallocates the small ints (-5 to 256), so 8-bit
+    samples already share the same int objects, while each 16-bit
+    sample would get its own (28 bytes on top of the 8-byte list
+    reference). For 16-bit data the values are therefore taken from
+    a table of preallocated ints, so that equal samples share the
+    same object.
+
+    Parameters
+    ----------
+    data: array, bytearray
+        The raw samples
+
+    Returns
+    -------
+    list[]
+        A vector with the samples
+
+    """
+    atype = getattr(data, "typecode", None)
+    if atype in ("h", "H"):
+        return [*map(_int_table(atype).__getitem__, data)]
+    return _mtx.vec_new(0, data)
+
+
 # ---------------------------------------------------------
 #                  Module initialization
 # ---------------------------------------------------------
@@ -3,6 +3,7 @@ WAV codec implementation
 
 """
 
+import sys
 import wave
 
 from array import array
@@ -50,17 +51,27 @@ class WAVCodec(MediaCodec):
         #         yield unpack_from("i", ib, 0)[0]
 
         def unpack24(b):
-            for i in range(0, len(b), 3):
-                yield int.from_bytes(b[i:i + 3],
-                                     "little", signed=True)
-
-        while nframes > 0:
-            fbytes = self._reader.readframes(BLOCKSIZE)
-            if bps == 24:
-                samples.extend(array(atype, unpack24(fbytes)))
-            else:
-                samples.frombytes(fbytes)
-            nframes -= (len(fbytes) / Bpf)
+            # Widen the 3-byte samples to 4-byte words with the sample
+            # in the upper bytes, so that the sign bit is preserved,
+            # then shift them back down.
+            wb = bytearray(len(b) // 3 * 4)
+            wb[1::4] = b[0::3]
+            wb[2::4] = b[1::3]
+            wb[3::4] = b[2::3]
+            # The widened words are little-endian, as in the file
+            words = array(atype, wb)
+            if sys.byteorder == "big":
+                words.byteswap()
+            return [w >> 8 for w in words]
+
+        # The whole data chunk is read and converted at once.
+        fbytes = self._reader.readframes(nframes)
+        if len(fbytes) != nframes * Bpf:
+            raise RuntimeError("Unexpected end of audio data")
+        if bps == 24:
+            samples.extend(unpack24(fbytes))
+        else:
+            samples.frombytes(fbytes)
         return samples
 
     def encode(self, data, meta):
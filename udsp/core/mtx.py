@@ -40,6 +40,7 @@ TODO: This module was born "procedural" but it should really
 """
 
 import functools as _fun
+import itertools as _itools
 import operator as _op
 from . import utils as _utl
 
@@ -1199,7 +1200,7 @@ def vec_new(elems, init=None):
     if callable(init):
         return [init(n) for n in range(elems)]
     elif _utl.isiterable(init):
-        return [i for i in init]
+        return list(init)
     else:
         return [init or 0] * elems
 
@@ -1283,10 +1284,10 @@ def vec_add(a, b):
     if type(b) is list:
         assert len(a) == len(b)
         # return [a[n] + b[n] for n in range(len(a))]
-        return [*map(lambda ai, bi: ai + bi, a, b)]
+        return [*map(_op.add, a, b)]
     else:
         # return [a[n] + b for n in range(len(a))]
-        return [*map(lambda ai: ai + b, a)]
+        return [*map(_op.add, a, _itools.repeat(b))]
 
 
 def vec_sub(a, b):
@@ -1309,10 +1310,10 @@ def vec_sub(a, b):
     if type(b) is list:
         assert len(a) == len(b)
         # return [a[n] - b[n] for n in range(len(a))]
-        return [*map(lambda ai, bi: ai - bi, a, b)]
+        return [*map(_op.sub, a, b)]
     else:
         # return [a[n] - b for n in range(len(a))]
-        return [*map(lambda ai: ai - b, a)]
+        return [*map(_op.sub, a, _itools.repeat(b))]
 
 
 def vec_mul(a, b):
@@ -1335,10 +1336,10 @@ def vec_mul(a, b):
     if type(b) is list:
         assert len(a) == len(b)
         # return [a[n] * b[n] for n in range(len(a))]
-        return [*map(lambda ai, bi: ai * bi, a, b)]
+        return [*map(_op.mul, a, b)]
     else:
         # return [a[n] * b for n in range(len(a))]
-        return [*map(lambda ai: ai * b, a)]
+        return [*map(_op.mul, a, _itools.repeat(b))]
 
 
 def vec_div(a, b):
@@ -1361,10 +1362,10 @@ def vec_div(a, b):
     if type(b) is list:
         assert len(a) == len(b)
         # return [a[n] / b[n] for n in range(len(a))]
-        return [*map(lambda ai, bi: ai / bi, a, b)]
+        return [*map(_op.truediv, a, b)]
     else:
         # return [a[n] / b for n in range(len(a))]
-        return [*map(lambda ai: ai / b, a)]
+        return [*map(_op.truediv, a, _itools.repeat(b))]
 
 
 def vec_pow(a, p):
@@ -1385,7 +1386,7 @@ def vec_pow(a, p):
 
     """
     # return [a[n] ** p for n in range(len(a))]
-    return [*map(lambda ai: ai ** p, a)]
+    return [*map(pow, a, _itools.repeat(p))]
 
 
 def vec_sum(a):
@@ -1537,7 +1538,7 @@ def vec_abs(a):
 
     """
     # return [abs(a[n]) for n in range(len(a))]
-    return [*map(lambda ai: abs(ai), a)]
+    return [*map(abs, a)]
 
 
 def vec_neg(a):
@@ -1556,7 +1557,7 @@ def vec_neg(a):
 
     """
     # return [-a[n] for n in range(len(a))]
-    return [*map(lambda ai: -ai, a)]
+    return [*map(_op.neg, a)]
 
 
 def vec_reverse(a):
@@ -10,8 +10,35 @@ statistical operations.
 import random as _rnd
 import math as _math
 
+from . import mtx as _mtx
 
-def rng_uniform(a=0, b=1):
+
+# The random number generator shared by all the rng_*() functions.
+# A private instance is used so that the library's random streams
+# are independent of (and don't alter) the global state of the
+# 'random' module.
+_rng = _rnd.Random()
+
+
+def seed(a=None):
+    """
+    Initializes the random number generator
+
+    Parameters
+    ----------
+    a: None, int, float, str, bytes
+        The seed. If None then the current system time (or an
+        OS-specific randomness source, if available) is used.
+
+    Returns
+    -------
+    None
+
+    """
+    _rng.seed(a)
+
+
+def rng_uniform(a=0, b=1, size=None):
     """
     Generate random numbers from a uniform distribution
 
@@ -21,17 +48,25 @@ def rng_uniform(a=0, b=1):
         The lower bound of the interval [a, b]
     b: float
         The upper bound of the interval [a, b]
+    size: None, int, tuple
+        The number of samples to draw (see _sample())
 
     Returns
     -------
-    float
+    float, list[], list[list]
         Random uniformly distributed numbers in the range [a, b]
 
     """
-    return _rnd.uniform(a, b)
+    rnd = _rng.random
+    d = b - a
 
+    def gen(n):
+        return [a + d * rnd() for _ in range(n)]
 
-def rng_normal(sigma=1, trunc=None):
+    return _sample(gen, size)
+
+
+def rng_normal(sigma=1, trunc=None, size=None):
     """
     Generate random numbers from a normal distribution
 
@@ -43,22 +78,35 @@ def rng_normal(sigma=1, trunc=None):
         Specifies whether the distribution is truncated. If it's
         not None then it must be a 2-tuple indicating the range where
         the distribution is defined.
+    size: None, int, tuple
+        The number of samples to draw (see _sample())
 
     Returns
     -------
-    float
+    float, list[], list[list]
         Random normally distributed numbers, optionally in a
         specific range if the distribution is truncated.
 
     """
-    while True:
-        v = _rnd.gauss(0, sigma)
-        if not trunc or trunc[0] <= v <= trunc[1]:
-            break
-    return v
+    rnd = _rng.random
+    log, sqrt = _math.log, _math.sqrt
+    cos, sin = _math.cos, _math.sin
+    tau = 2 * _math.pi
+
+    def gen(n):
+        # Box-Muller transform, giving two samples for each pair
+        # of uniform numbers in the batch
+        m = (n + 1) // 2
+        r = [sigma * sqrt(-2 * log(1 - rnd())) for _ in range(m)]
+        t = [tau * rnd() for _ in range(m)]
+        v = [ri * cos(ti) for ri, ti in zip(r, t)]
+        v.extend([ri * sin(ti) for ri, ti in zip(r, t)])
+        return v[:n]
+
+    return _sample(gen, size, trunc)
 
 
-def rng_cauchy_lorentz(gamma=1, trunc=None):
+def rng_cauchy_lorentz(gamma=1, trunc=None, size=None):
     """
     Generate random numbers from a Cauchy-Lorentz distribution
 
@@ -70,26 +118,28 @@ def rng_cauchy_lorentz(gamma=1, trunc=None):
         Specifies whether the distribution is truncated. If it's
         not None then it must be a 2-tuple indicating the range where
         the distribution is defined.
+    size: None, int, tuple
+        The number of samples to draw (see _sample())
 
     Returns
     -------
-    float
+    float, list[], list[list]
         Random Cauchy-Lorentz distributed numbers, optionally in a
         specific range if the distribution is truncated.
 
     """
-    while True:
-        while True:
-            u = _rnd.random()
-            if u != 0.5:
-                break
-        v = gamma * _math.tan(_math.pi * u)
-        if not trunc or trunc[0] <= v <= trunc[1]:
-            break
-    return v
-
-
-def rng_laplace(lambd=1, trunc=None):
+    rnd = _rng.random
+    tan = _math.tan
+    pi = _math.pi
+
+    def gen(n):
+        u = [rnd() for _ in range(n)]
+        return [gamma * tan(pi * ui) for ui in u if ui != 0.5]
+
+    return _sample(gen, size, trunc)
+
+
+def rng_laplace(lambd=1, trunc=None, size=None):
     """
     Generate random numbers from a Laplace distribution
 
@@ -101,22 +151,65 @@ def rng_laplace(lambd=1, trunc=None):
         Specifies whether the distribution is truncated. If it's
         not None then it must be a 2-tuple indicating the range where
         the distribution is defined.
+    size: None, int, tuple
+        The number of samples to draw (see _sample())
 
     Returns
     -------
-    float
-        A Laplace distributed number, optionally in a
+    float, list[], list[list]
+        Laplace distributed numbers, optionally in a
         specific range if the distribution is truncated.
 
     """
-    while True:
-        while True:
-            u = 2 * _rnd.random() - 1
-            if u != 0:
-                break
-        s = -1 if u < 0 else 1
-        v = -s * lambd * _math.log(s * u)
-        if not trunc or trunc[0] <= v <= trunc[1]:
-            break
-    return v
+    rnd = _rng.random
+    log = _math.log
+
+    def gen(n):
+        u = [2 * rnd() - 1 for _ in range(n)]
+        return [-lambd * log(ui) if ui > 0 else lambd * log(-ui)
+                for ui in u if ui != 0]
+
+    return _sample(gen, size, trunc)
+
+
+def _sample(gen, size, trunc=None):
+    """
+    Draws a batch of samples from a random number generator
 
+    Parameters
+    ----------
+    gen: callable
+        A function gen(n) returning a list with at most n random
+        numbers. Fewer numbers may be returned if some of the
+        draws have been rejected.
+    size: None, int, tuple
+        The number of samples to draw. If None then a single number
+        is returned, if it's an int then a vector with the given
+        number of elements is returned, and if it's a 2-tuple
+        (rows, cols) then a matrix of the given size is returned.
+    trunc: None, tuple
+        If not None, a 2-tuple (a, b) indicating the range where the
+        samples must fall. Samples outside of this range are rejected
+        and drawn again.
+
+    Returns
+    -------
+    float, list[], list[list]
+        The random samples
+
+    """
+    if size is None:
+        return _sample(gen, 1, trunc)[0]
+
+    if not isinstance(size, int):
+        rows, cols = size
+        return _mtx.mat_unflatten(_sample(gen, rows * cols, trunc), size)
+
+    samples = []
+    while len(samples) < size:
+        s = gen(size - len(samples))
+        if trunc:
+            a, b = trunc
+            s = [v for v in s if a <= v <= b]
+        samples.extend(s)
+    return samples
@@ -5,6 +5,7 @@ Miscellaneous utility functions used throughout the library.
 
 import operator as _op
 import functools as _func
+import bisect as _bis
 import math as _m
 import cmath as _cm
 
@@ -138,6 +139,59 @@ def to_meshgrid(x):
     # return N, M
 
 
+def to_axes(x):
+    """
+    Extracts the coordinate axes of a rectilinear 2D grid of points
+
+    The grid is assumed to be rectilinear, that is the first
+    coordinate of the points only varies along the rows and the
+    second coordinate only along the columns, as is the case for
+    the grids generated by the built-in signals.
+
+    Parameters
+    ----------
+    x: list[list]
+        A 2D array of 2-tuples (y,x)
+
+    Returns
+    -------
+    tuple
+        A 2-tuple with the vectors of the coordinates along the
+        rows (first dimension) and columns (second dimension).
+        If the grid is empty then both vectors are empty.
+
+    """
+    if not x or not x[0]:
+        return [], []
+    return [row[0][0] for row in x], [p[1] for p in x[0]]
+
+
+def find_range(v, a, b):
+    """
+    Finds the elements of a sorted sequence lying in an interval
+
+    Parameters
+    ----------
+    v: list[]
+        A sequence sorted in ascending order
+    a: scalar
+        The lower bound of the interval [a, b]
+    b: scalar
+        The upper bound of the interval [a, b]
+
+    Returns
+    -------
+    tuple
+        A 2-tuple (n1, n2) such that a <= v[n] <= b for all and only
+        the indices n1 <= n < n2. If no element lies in the interval
+        then n1 == n2.
+
+    """
+    n1 = _bis.bisect_left(v, a)
+    n2 = _bis.bisect_right(v, b)
+    return n1, max(n1, n2)
+
+
 def all_same(v, array):
     """
     Checks whether all elements in an array ar equal to a given value
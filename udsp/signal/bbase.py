@@ -9,6 +9,50 @@ from ..core import mtx as _mtx
 from ..core import utils as _utl
 
 
+def _grid1d(N, dx):
+    """
+    Creates a 1D uniform sampling grid
+
+    Parameters
+    ----------
+    N: int
+        The number of samples
+    dx: float
+        The sampling period
+
+    Returns
+    -------
+    list[]
+        The grid points
+
+    """
+    return _mtx.vec_new(N, lambda n: n * dx)
+
+
+def _grid2d(N, M, dx1, dx2):
+    """
+    Creates a 2D uniform sampling grid
+
+    Parameters
+    ----------
+    N: int
+        The number of samples along the first dimension (rows)
+    M: int
+        The number of samples along the second dimension (columns)
+    dx1: float
+        The sampling period along the first dimension
+    dx2: float
+        The sampling period along the second dimension
+
+    Returns
+    -------
+    list[list]
+        The grid points as rows of 2-tuples
+
+    """
+    return _mtx.mat_new(N, M, lambda n, m: (n * dx1, m * dx2))
+
+
 class Builtin1D(Signal1D):
     """
     Abstract base class for built-in 1D signals
@@ -47,7 +91,7 @@ class Builtin1D(Signal1D):
 
         dx = 1 / self._sfreq
         N = round(self._length * self._sfreq)
-        X = _mtx.vec_new(N, lambda n: n * dx)
+        X = self._make_grid(N, dx)
         Y = self._generate(X)
 
         self._X = X
@@ -69,6 +113,29 @@ class Builtin1D(Signal1D):
 
         return self
 
+    def _make_grid(self, N, dx):
+        """
+        Creates the sampling grid of the signal
+
+        Subclasses may override this method to reuse a grid that
+        has already been created (e.g. by another channel of the
+        same audio file).
+
+        Parameters
+        ----------
+        N: int
+            The number of samples
+        dx: float
+            The sampling period
+
+        Returns
+        -------
+        list[]
+            The grid points
+
+        """
+        return _grid1d(N, dx)
+
     def _generate(self, x):
         """
         The signal's generating function
@@ -80,7 +147,8 @@ class Builtin1D(Signal1D):
         ----------
         x: list[]
             A 1D array representing the points where the function
-            must be evaluated.
+            must be evaluated. The points are uniformly spaced and
+            sorted in ascending order, i.e. x[n] = n * dx.
 
         Returns
         -------
@@ -132,7 +200,7 @@ class Builtin2D(Signal2D):
         dim1 = round(self._length[0] * self._sfreq)
         dim2 = round(self._length[1] * self._sfreq)
 
-        X = _mtx.mat_new(dim1, dim2, lambda n, m: (n * dx1, m * dx2))
+        X = self._make_grid(dim1, dim2, dx1, dx2)
         Y = self._generate(X)
 
         assert _mtx.mat_dims_equal(X, Y, full_check=True)
@@ -155,6 +223,33 @@ class Builtin2D(Signal2D):
         self._length = (dim1 * dx1, dim2 * dx2)
         return self
 
+    def _make_grid(self, N, M, dx1, dx2):
+        """
+        Creates the sampling grid of the signal
+
+        Subclasses may override this method to reuse a grid that
+        has already been created (e.g. by another channel of the
+        same image).
+
+        Parameters
+        ----------
+        N: int
+            The number of samples along the first dimension (rows)
+        M: int
+            The number of samples along the second dimension (columns)
+        dx1: float
+            The sampling period along the first dimension
+        dx2: float
+            The sampling period along the second dimension
+
+        Returns
+        -------
+        list[list]
+            The grid points as rows of 2-tuples
+
+        """
+        return _grid2d(N, M, dx1, dx2)
+
     def _generate(self, x):
         """
         The signal's generating function
@@ -166,7 +261,9 @@ class Builtin2D(Signal2D):
         ----------
         x: list[list[]]
             A 2D array representing the points where the function
-            must be evaluated.
+            must be evaluated. The points form a uniform rectilinear
+            grid sorted in ascending order along both dimensions,
+            i.e. x[n][m] = (n * dx1, m * dx2).
 
         Returns
         -------
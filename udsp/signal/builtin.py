@@ -4,6 +4,8 @@ Built-in signals commonly used in DSP
 """
 
 import math as _math
+import operator as _op
+import functools as _fun
 
 from .base import Signal
 from .bbase import Builtin1D, Builtin2D
@@ -30,6 +32,26 @@ class RNGMixin:
         "laplace": _stat.rng_laplace,
     }
 
+    def _get_rng(self):
+        """
+        Gets the RNG for the signal's p.d.f.
+
+        The RNG and its parameters are resolved only once, so that
+        they don't need to be looked up for each drawn sample.
+
+        Returns
+        -------
+        callable
+            A function f(size) drawing 'size' samples from the
+            p.d.f. with the given parameters (see core.stat)
+
+        """
+        if self.pdf not in self.dist:
+            raise ValueError(
+                "Invalid p.d.f. (%s)" % self.pdf
+            )
+        return _fun.partial(self.dist[self.pdf], **self.pdf_params or {})
+
 
 # ---------------------------------------------------------
 #                       1D signals
@@ -52,11 +74,8 @@ class Const1D(Builtin1D):
         self.make()
 
     def _generate(self, x):
-
-        def f(n):
-            return self.k
-
-        return _mtx.vec_new(len(x), f)
+        # vec_new() would replace a falsy constant (e.g. 0.0) by 0
+        return [self.k] * len(x)
 
 
 class Pulse1D(Builtin1D):
@@ -88,10 +107,12 @@ class Pulse1D(Builtin1D):
     def _generate(self, x):
         x1, x2 = self.xo - self.w / 2, self.xo + self.w / 2
 
-        def f(n):
-            return self.a if x1 <= x[n] <= x2 else 0
-
-        return _mtx.vec_new(len(x), f)
+        # The grid is sorted, so the pulse spans a contiguous range
+        # of samples that is located by bisection.
+        n1, n2 = _utl.find_range(x, x1, x2)
+        y = _mtx.vec_new(len(x), 0)
+        y[n1: n2] = [self.a] * (n2 - n1)
+        return y
 
 
 class Gaussian1D(Builtin1D):
@@ -121,13 +142,14 @@ class Gaussian1D(Builtin1D):
         self.make()
 
     def _generate(self, x):
+        k, u = self.k, self.u
+        c = -1 / (2 * self.s ** 2)
+        exp = _math.exp
 
-        def f(n):
-            return self.k * _math.exp(
-                -(x[n] - self.u) ** 2 / (2 * self.s ** 2)
-            )
+        def f(xn):
+            return k * exp(c * (xn - u) ** 2)
 
-        return _mtx.vec_new(len(x), f)
+        return _mtx.vec_compose([x], f)
 
 
 class Sinewave1D(Builtin1D):
@@ -157,13 +179,14 @@ class Sinewave1D(Builtin1D):
         self.make()
 
     def _generate(self, x):
+        a, p = self.a, self.p
+        w = 2 * _math.pi * self.f
+        sin = _math.sin
 
-        def f(n):
-            return self.a * _math.sin(
-                2 * _math.pi * self.f * x[n] + self.p
-            )
+        def f(xn):
+            return a * sin(w * xn + p)
 
-        return _mtx.vec_new(len(x), f)
+        return _mtx.vec_compose([x], f)
 
 
 class Logistic1D(Builtin1D):
@@ -193,11 +216,52 @@ class Logistic1D(Builtin1D):
         self.make()
 
     def _generate(self, x):
+        a, k, xo = self.a, -self.k, self.xo
+        exp = _math.exp
+
+        def f(xn):
+            return a / (1 + exp(k * (xn - xo)))
+
+        return _mtx.vec_compose([x], f)
+
+
+class Jaehne1D(Builtin1D):
+    """
+    Jaehne signal
+
+    A sine wave whose frequency increases linearly from 0 at the
+    first sample (linear chirp), that is
+
+        y[n] = a * sin(0.5 * pi * n^2 / N), n = 0, ..., N - 1
+
+    where N is the number of samples. The frequency would reach
+    half the sampling frequency at n = N, one sample past the end.
+
+    Attributes
+    ----------
+    a: float
+        The amplitude of the wave
+
+    """
+    def __init__(self,
+                 a=1,
+                 **kwargs):
+
+        super().__init__(**kwargs)
+        self.a = a
+        self.make()
+
+    def _generate(self, x):
+        a = self.a
+        c = 0.5 * _math.pi / max(len(x), 1)
+        sin = _math.sin
 
+        # The phase only depends on the sample index and is computed
+        # in closed form (with the square in integer arithmetic).
         def f(n):
-            return self.a / (1 + _math.exp(-self.k * (x[n] - self.xo)))
+            return a * sin(c * (n * n))
 
-        return _mtx.vec_new(len(x), f)
+        return _mtx.vec_compose([range(len(x))], f)
 
 
 class Noise1D(Builtin1D, RNGMixin):
@@ -209,6 +273,10 @@ class Noise1D(Builtin1D, RNGMixin):
         """
         Creates a noise signal
 
+        The samples are drawn from the random generator of the
+        udsp.core.stat module, not the global one of the 'random'
+        module. Use stat.seed() to get reproducible signals.
+
         Parameters
         ----------
         pdf: {"uniform","normal","lorentz","laplace"}
@@ -242,10 +310,7 @@ class Noise1D(Builtin1D, RNGMixin):
 
     def _generate(self, x):
 
-        def f(n):
-            return self.dist[self.pdf](**self.pdf_params or {})
-
-        return _mtx.vec_new(len(x), f)
+        return self._get_rng()(size=len(x))
 
 
 class AudioChannel(Builtin1D):
@@ -260,6 +325,10 @@ class AudioChannel(Builtin1D):
         The channel number
     _bps: int
         The bits per sample
+    _shared_grid: None, list
+        A grid to be reused by make() if it has the size and the
+        sampling period of the channel (only set by from_file()
+        while the channel is being created)
 
     Properties
     ----------
@@ -272,6 +341,10 @@ class AudioChannel(Builtin1D):
     """
     def __init__(self, data, bps=16, cid=0, **kwargs):
 
+        # The shared grid is only needed to create the signal, so it
+        # is dropped afterwards to not keep it alive with the channel.
+        # It is passed privately by from_file(), see _make_grid().
+        grid = kwargs.pop("_grid", None)
         super().__init__(**kwargs)
         if isinstance(data, Signal):
             self._data = data.get()
@@ -283,7 +356,11 @@ class AudioChannel(Builtin1D):
             self._sfreq = data.sfreq
         if not self._length:
             self._length = len(data) / self.sfreq
-        self.make()
+        self._shared_grid = grid
+        try:
+            self.make()
+        finally:
+            self._shared_grid = None
 
     @classmethod
     def from_file(cls, filename, mono=False):
@@ -320,7 +397,8 @@ class AudioChannel(Builtin1D):
                     length=(audio.metadata.size /
                             audio.metadata.resolution),
                     sfreq=audio.metadata.resolution,
-                    xunits="s"
+                    xunits="s",
+                    _grid=channels[0]._X if channels else None
                 )
                 channels.append(channel)
         finally:
@@ -387,6 +465,15 @@ class AudioChannel(Builtin1D):
             del audio
         return meta
 
+    def _make_grid(self, N, dx):
+        # All the channels of an audio file have the same grid
+        # so it is created once and then copied for each channel
+        grid = self._shared_grid
+        if (grid is not None and len(grid) == N and
+                (N < 2 or grid[1] == dx)):
+            return _mtx.vec_copy(grid)
+        return super()._make_grid(N, dx)
+
     @staticmethod
     def _to_mono(channels):
         """
@@ -406,11 +493,11 @@ class AudioChannel(Builtin1D):
             return channels
         # Audio is stereo
         elif len(channels) == 2:
-            # Convert to mono
-            return [_mtx.vec_compose(
-                channels,
-                lambda l, r: round((l + r) / 2)
-            )]
+            # Convert to mono. The samples are integers, so the mean
+            # is computed with integer ops only, rounding halves to
+            # even as round((l + r) / 2) would do.
+            return [[(s >> 1) + (s & (s >> 1) & 1)
+                     for s in map(_op.add, *channels)]]
         else:
             raise RuntimeError("Bug")
 
@@ -450,11 +537,7 @@ class Const2D(Builtin2D):
         self.make()
 
     def _generate(self, x):
-
-        def f(n, m):
-            return self.k
-
-        return _mtx.mat_new(len(x), len(x[0]), f)
+        return _mtx.mat_new(len(x), len(x[0]), self.k)
 
 
 class Pulse2D(Builtin2D):
@@ -488,12 +571,18 @@ class Pulse2D(Builtin2D):
         x1, x2 = self.xo[0] - self.w[0] / 2, self.xo[0] + self.w[0] / 2
         y1, y2 = self.xo[1] - self.w[1] / 2, self.xo[1] + self.w[1] / 2
 
-        def f(n, m):
-            def inbox(p):
-                return (y1 <= p[0] <= y2) and (x1 <= p[1] <= x2)
-            return self.a if inbox(x[n][m]) else 0
+        # The pulse is separable, so each row is either all zeros
+        # or a copy of the same 1D pulse along the columns. The axes
+        # are sorted, so the pulse edges are located by bisection.
+        ys, xs = _utl.to_axes(x)
+        n1, n2 = _utl.find_range(ys, y1, y2)
+        m1, m2 = _utl.find_range(xs, x1, x2)
+        row = _mtx.vec_new(len(xs), 0)
+        row[m1: m2] = [self.a] * (m2 - m1)
+        zero = _mtx.vec_new(len(xs), 0)
 
-        return _mtx.mat_new(len(x), len(x[0]), f)
+        return [_mtx.vec_copy(row if n1 <= n < n2 else zero)
+                for n in range(len(ys))]
 
 
 class Gaussian2D(Builtin2D):
@@ -524,13 +613,25 @@ class Gaussian2D(Builtin2D):
 
     def _generate(self, x):
 
-        def f(n, m):
-            return self.k * _math.exp(
-                - (x[n][m][0] - self.u[0]) ** 2 / (2 * self.s[0] ** 2)
-                - (x[n][m][1] - self.u[1]) ** 2 / (2 * self.s[1] ** 2)
-            )
+        # The Gaussian is separable, so it is computed as the outer
+        # product of the 1D Gaussians along the two axes.
+        ys, xs = _utl.to_axes(x)
+        uy, ux = self.u
+        k = self.k
+        cy = -1 / (2 * self.s[0] ** 2)
+        cx = -1 / (2 * self.s[1] ** 2)
+        exp = _math.exp
+
+        def fy(v):
+            return exp(cy * (v - uy) ** 2)
+
+        def fx(v):
+            return k * exp(cx * (v - ux) ** 2)
+
+        gy = _mtx.vec_compose([ys], fy)
+        gx = _mtx.vec_compose([xs], fx)
 
-        return _mtx.mat_new(len(x), len(x[0]), f)
+        return [_mtx.vec_mul(gx, g) for g in gy]
 
 
 class Noise2D(Builtin2D, RNGMixin):
@@ -542,6 +643,10 @@ class Noise2D(Builtin2D, RNGMixin):
         """
         Creates a noise signal
 
+        The samples are drawn from the random generator of the
+        udsp.core.stat module, not the global one of the 'random'
+        module. Use stat.seed() to get reproducible signals.
+
         Parameters
         ----------
         pdf: {"uniform","normal","lorentz","laplace"}
@@ -575,10 +680,7 @@ class Noise2D(Builtin2D, RNGMixin):
 
     def _generate(self, x):
 
-        def f(n, m):
-            return self.dist[self.pdf](**self.pdf_params or {})
-
-        return _mtx.mat_new(len(x), len(x[0]), f)
+        return self._get_rng()(size=_mtx.mat_dim(x))
 
 
 class ImageChannel(Builtin2D):
@@ -593,6 +695,10 @@ class ImageChannel(Builtin2D):
         The channel number
     _bps: int
         The bits per sample
+    _shared_grid: None, list[list]
+        A grid to be reused by make() if it has the size and the
+        sampling periods of the channel (only set by from_file()
+        while the channel is being created)
 
     Properties
     ----------
@@ -605,6 +711,10 @@ class ImageChannel(Builtin2D):
     """
     def __init__(self, data, bps=8, cid=0, **kwargs):
 
+        # The shared grid is only needed to create the signal, so it
+        # is dropped afterwards to not keep it alive with the channel.
+        # It is passed privately by from_file(), see _make_grid().
+        grid = kwargs.pop("_grid", None)
         super().__init__(**kwargs)
         if isinstance(data, Signal):
             self._data = data.get()
@@ -616,7 +726,11 @@ class ImageChannel(Builtin2D):
             self._sfreq = data.sfreq
         if not self._length:
             self._length = _mtx.mat_dim(data)
-        self.make()
+        self._shared_grid = grid
+        try:
+            self.make()
+        finally:
+            self._shared_grid = None
 
     @classmethod
     def from_file(cls, filename, mono=False):
@@ -642,7 +756,7 @@ class ImageChannel(Builtin2D):
             if not mono:
                 data = image.load()
             else:
-                data = cls._to_mono(image.load())
+                data = cls._to_mono(image.load(), image.metadata.bps)
 
             channels = []
             for c, _ in enumerate(data):
@@ -650,7 +764,8 @@ class ImageChannel(Builtin2D):
                     data=data[c],
                     bps=image.metadata.bps,
                     cid=c,
-                    length=(*reversed(image.metadata.size),)
+                    length=(*reversed(image.metadata.size),),
+                    _grid=channels[0]._X if channels else None
                 )
                 channels.append(channel)
         finally:
@@ -717,14 +832,28 @@ class ImageChannel(Builtin2D):
             del image
         return meta
 
+    def _make_grid(self, N, M, dx1, dx2):
+        # All the channels of an image have the same grid so it
+        # is created once and then copied for each channel. Only
+        # the rows are copied, the (immutable) points are shared.
+        grid = self._shared_grid
+        if (grid is not None and _mtx.mat_dim(grid) == (N, M) and
+                (not M or grid[-1][-1] == ((N - 1) * dx1,
+                                           (M - 1) * dx2))):
+            return _mtx.mat_copy(grid)
+        return super()._make_grid(N, M, dx1, dx2)
+
     @staticmethod
-    def _to_mono(channels):
+    def _to_mono(channels, bps=8):
         """
         Convert a multi-color image to monocolor
 
         Parameters
         ----------
         channels: list[list]
+        bps: int
+            The bits per sample. All the samples must be in the
+            range [0, 2^bps).
 
         Returns
         -------
@@ -738,13 +867,14 @@ class ImageChannel(Builtin2D):
         elif len(channels) in (3, 4):
             cplanes = (channels if len(channels) == 3
                        else channels[:3])
-            # Convert to grayscale
-            return [_mtx.mat_compose(
-                cplanes,
-                lambda r, g, b: round(0.2126 * r +
-                                      0.7152 * g +
-                                      0.0722 * b)
-            )]
+            # Convert to grayscale. The samples are integers in
+            # [0, 2^bps), so the weighted color components are
+            # looked up from tables rather than computed per pixel.
+            wr, wg, wb = (_mtx.vec_new(1 << bps, lambda v: w * v)
+                          for w in (0.2126, 0.7152, 0.0722))
+            return [[[round(wr[r] + wg[g] + wb[b])
+                      for r, g, b in zip(*rows)]
+                     for rows in zip(*cplanes)]]
         else:
             raise RuntimeError("Bug")
 
@@ -135,7 +135,7 @@ class Signal1D(Signal):
             )
 
         if y and not x:
-            x = _mtx.vec_new(len(y), lambda n: n)
+            x = _mtx.vec_new(len(y), range(len(y)))
 
         self._length = length or len(x)
         self._sfreq = len(x) / self._length